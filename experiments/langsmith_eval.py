@@ -1,22 +1,68 @@
 # experiments/langsmith_eval.py
 
 from dotenv import load_dotenv
+import asyncio
 import os
 import sys
+import traceback
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 load_dotenv()
 
-from langsmith.evaluation import evaluate
+from langsmith.evaluation import aevaluate
 from src.state import create_initial_state
 from src.graph import app
 
 
-def run_agent(inputs: dict) -> dict:
+# Scenario name prefix -> what must have happened in that call, beyond
+# the field-by-field checks of the other evaluators
+SCENARIO_CHECKS = {
+    # Willing customer is taken into payment negotiation
+    "Happy Path": lambda out: bool(out.get("plans_offered")) or bool(out.get("ptp_recorded")),
+    # Call closes without raising a ticket or promise
+    "Already Paid": lambda out: bool(out.get("is_complete")) and not out.get("dispute_recorded") and not out.get("ptp_recorded"),
+    # A dispute ticket is created
+    "Dispute": lambda out: bool(out.get("dispute_recorded")),
+    # Customer who can't pay in full is offered plans
+    "Negotiate Accept": lambda out: bool(out.get("plans_offered")),
+    # Debt is never disclosed to an unverified caller
+    "Verification Failed": lambda out: out.get("disclosed") is False,
+    # Call closes without raising a ticket
+    "Callback": lambda out: bool(out.get("is_complete")) and not out.get("dispute_recorded"),
+}
+
+
+async def step_until_awaiting(state: dict, config: dict) -> dict:
+    """
+    Advance the graph in a single streamed run and stop as soon as
+    the agent is waiting for the customer or the call is complete.
+    """
+    async for values in app.astream(state, config, stream_mode="values"):
+        state = values
+        if values.get("awaiting_user") or values.get("is_complete"):
+            break
+    return state
+
+
+async def provide_input_and_continue(state: dict, user_input: str, config: dict) -> dict:
+    """
+    Record the customer's reply on the state in place and resume the graph.
+    """
+    state["messages"].append({
+        "role": "user",
+        "content": user_input
+    })
+    state["last_user_input"] = user_input
+    state["awaiting_user"] = False
+    return await step_until_awaiting(state, config)
+
+
+async def run_agent(inputs: dict) -> dict:
     """
     Run agent through complete conversation flow.
+    Async so that aevaluate can overlap the LLM-bound cases.
     """
     phone = inputs["phone"]
     scenario = inputs["scenario"]
@@ -33,21 +79,15 @@ def run_agent(inputs: dict) -> dict:
         }
 
     try:
-        # Use invoke instead of stream for cleaner state management
+        # Each step streams one graph run up to the next pause
         config = {"recursion_limit": 25}
         
         # Step 1: Greeting
-        state = app.invoke(state, config)
+        state = await step_until_awaiting(state, config)
         
         # Step 2: Respond to greeting
         if "greeting" in user_responses and state.get("awaiting_user"):
-            state["messages"].append({
-                "role": "user",
-                "content": user_responses["greeting"]
-            })
-            state["last_user_input"] = user_responses["greeting"]
-            state["awaiting_user"] = False
-            state = app.invoke(state, config)
+            state = await provide_input_and_continue(state, user_responses["greeting"], config)
         
         # Step 3: Handle verification
         if "verification_attempts" in user_responses:
@@ -56,46 +96,22 @@ def run_agent(inputs: dict) -> dict:
                 if state.get("is_complete"):
                     break
                 if state.get("awaiting_user"):
-                    state["messages"].append({
-                        "role": "user",
-                        "content": attempt
-                    })
-                    state["last_user_input"] = attempt
-                    state["awaiting_user"] = False
-                    state = app.invoke(state, config)
+                    state = await provide_input_and_continue(state, attempt, config)
         
         elif "verification" in user_responses:
             # Single verification attempt (successful)
             if state.get("awaiting_user") and not state.get("is_complete"):
-                state["messages"].append({
-                    "role": "user",
-                    "content": user_responses["verification"]
-                })
-                state["last_user_input"] = user_responses["verification"]
-                state["awaiting_user"] = False
-                state = app.invoke(state, config)
+                state = await provide_input_and_continue(state, user_responses["verification"], config)
         
         # Step 4: Handle disclosure response
         if "disclosure" in user_responses and not state.get("is_complete"):
             if state.get("awaiting_user"):
-                state["messages"].append({
-                    "role": "user",
-                    "content": user_responses["disclosure"]
-                })
-                state["last_user_input"] = user_responses["disclosure"]
-                state["awaiting_user"] = False
-                state = app.invoke(state, config)
+                state = await provide_input_and_continue(state, user_responses["disclosure"], config)
         
         # Step 5: Handle negotiation response (if applicable)
         if "negotiation" in user_responses and not state.get("is_complete"):
             if state.get("awaiting_user"):
-                state["messages"].append({
-                    "role": "user",
-                    "content": user_responses["negotiation"]
-                })
-                state["last_user_input"] = user_responses["negotiation"]
-                state["awaiting_user"] = False
-                state = app.invoke(state, config)
+                state = await provide_input_and_continue(state, user_responses["negotiation"], config)
         
         # Return final state outputs
         return {
@@ -103,11 +119,14 @@ def run_agent(inputs: dict) -> dict:
             "call_outcome": state.get("call_outcome"),
             "payment_status": state.get("payment_status"),
             "final_stage": state.get("stage"),
-            "is_complete": state.get("is_complete")
+            "is_complete": state.get("is_complete"),
+            "disclosed": state.get("has_disclosed"),
+            "plans_offered": len(state.get("offered_plans") or []),
+            "ptp_recorded": state.get("ptp_date") is not None,
+            "dispute_recorded": state.get("dispute_id") is not None,
         }
 
     except Exception as e:
-        import traceback
         error_trace = traceback.format_exc()
         print(f"ERROR in {scenario}: {e}")
         print(error_trace)
@@ -120,7 +139,7 @@ def run_agent(inputs: dict) -> dict:
         }
 
 
-def check_verified(run, example):
+async def check_verified(run, example):
     """Check if verification status matches expected."""
     expected = example.outputs.get("is_verified")
     actual = run.outputs.get("is_verified")
@@ -133,7 +152,7 @@ def check_verified(run, example):
     }
 
 
-def check_call_outcome(run, example):
+async def check_call_outcome(run, example):
     """Check if call outcome matches expected."""
     expected = example.outputs.get("call_outcome")
     actual = run.outputs.get("call_outcome")
@@ -146,7 +165,7 @@ def check_call_outcome(run, example):
     }
 
 
-def check_payment_status(run, example):
+async def check_payment_status(run, example):
     """Check if payment status matches expected."""
     expected = example.outputs.get("payment_status")
     actual = run.outputs.get("payment_status")
@@ -163,25 +182,54 @@ def check_payment_status(run, example):
     }
 
 
-if __name__ == "__main__":
+async def check_scenario_outcomes(run, example):
+    """Check what this example's scenario is about (ticket, plans, no disclosure)."""
+    scenario = example.inputs.get("scenario", "")
+    
+    for prefix, check in SCENARIO_CHECKS.items():
+        if scenario.startswith(prefix):
+            passed = check(run.outputs)
+            return {
+                "score": 1 if passed else 0,
+                "key": "scenario_outcome"
+            }
+    
+    return {
+        "score": 0,
+        "key": "scenario_outcome"
+    }
+
+
+async def main():
     print("=" * 60)
     print("Starting LangSmith Evaluation")
-    print("Testing 6 Required Scenarios")
+    print("Testing 6 Required Scenarios (5 repetitions each)")
     print("=" * 60)
     
-    results = evaluate(
+    # Cases are independent (each builds its own state), so let several
+    # of them wait on the LLM at the same time. LLM replies vary between
+    # runs, so each case is repeated to get a stable pass rate.
+    results = await aevaluate(
         run_agent,
         data="debt-collection-eval",
         evaluators=[
             check_verified,
             check_call_outcome,
-            check_payment_status
+            check_payment_status,
+            check_scenario_outcomes
         ],
-        experiment_prefix="v4-fixed-invoke",
-        max_concurrency=1
+        experiment_prefix="v5-async-invoke",
+        num_repetitions=5,
+        max_concurrency=20,
     )
 
+    print(f"\nExperiment: {results.experiment_name}")
+
     print("\n" + "=" * 60)
     print("✅ Evaluation Complete!")
     print("=" * 60)
-    print("\nView detailed results at the URL above ☝️")
\ No newline at end of file
+    print("\nView detailed results at the URL above ☝️")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,8 +1,18 @@
 # main.py
 
+import logging
+import os
+import traceback
+
 from src.state import create_initial_state
 from src.graph import app
 
+# Set DCA_DEBUG=1 to print per-turn graph state and node debug logs
+DEBUG = os.environ.get("DCA_DEBUG") == "1"
+
+logging.basicConfig(format="%(message)s")
+logging.getLogger("src").setLevel(logging.DEBUG if DEBUG else logging.WARNING)
+
 
 def main():
     print("=== Debt Collection Agent Test ===")
@@ -32,31 +42,30 @@ def main():
             break
             
         try:
-            # Debug info
-            stage = state.get('stage')
-            awaiting = state.get('awaiting_user')
-            verified = state.get('is_verified')
-            payment_status = state.get('payment_status')
-            
-            print(f"[DEBUG] Before invoke - Stage: {stage}, Awaiting: {awaiting}, Payment: {payment_status}")
+            if DEBUG:
+                print(f"[DEBUG] Before invoke - Stage: {state.get('stage')}, Awaiting: {state.get('awaiting_user')}, Payment: {state.get('payment_status')}")
             
             # Invoke the graph
             state = app.invoke(state, config={"recursion_limit": 25})
             
-            # Debug after invoke
-            print(f"[DEBUG] After invoke - Stage: {state.get('stage')}, Awaiting: {state.get('awaiting_user')}, Payment: {state.get('payment_status')}")
+            if DEBUG:
+                print(f"[DEBUG] After invoke - Stage: {state.get('stage')}, Awaiting: {state.get('awaiting_user')}, Payment: {state.get('payment_status')}")
             
             # Print the last agent message if it exists
-            messages = state.get("messages", [])
-            if messages and messages[-1]["role"] == "assistant":
-                print(f"Agent: {messages[-1]['content']}\n")
+            messages = state.get("messages", ())
+            if messages:
+                last_msg = messages[-1]
+                if last_msg["role"] == "assistant":
+                    print(f"Agent: {last_msg['content']}\n")
             
             # Check if call is complete
             if state.get("is_complete"):
                 break
             
+            awaiting = state.get("awaiting_user")
+            
             # If the agent is waiting for user input, get it
-            if state.get("awaiting_user"):
+            if awaiting:
                 user_input = input("You: ").strip()
                 
                 # Allow empty input but warn user
@@ -83,14 +92,12 @@ def main():
                 if current_stage in ["greeting", "verification", "disclosure", "negotiation"]:
                     print(f"\n[WARNING] Stage '{current_stage}' should be awaiting user input")
                 
-                # If we're not awaiting and not complete, something went wrong
-                if not state.get("awaiting_user") and not state.get("is_complete"):
-                    print(f"\n[DEBUG] Unexpected state - ending call")
-                    break
+                # Not awaiting and not complete, so something went wrong
+                print(f"\n[DEBUG] Unexpected state - ending call")
+                break
                 
         except Exception as e:
             print(f"\nError during call: {e}")
-            import traceback
             traceback.print_exc()
             break
 
@@ -5,22 +5,28 @@ Mock data for debt collection agent.
 In production, this would come from CRM APIs.
 """
 
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from itertools import count
+from types import MappingProxyType
 
-# Customer database (keyed by phone number)
-CUSTOMERS = {
-    "+919876543210": {
+
+# Customer database (keyed by customer ID)
+_CUSTOMERS_RAW = {
+    "CUST001": {
         "id": "CUST001",
         "name": "Rajesh Kumar",
         "dob": "15-03-1985",  # DD-MM-YYYY
         "phone": "+919876543210",
     },
-    "+919876543211": {
+    "CUST002": {
         "id": "CUST002",
         "name": "Priya Sharma",
         "dob": "22-07-1990",
         "phone": "+919876543211",
     },
-    "+919876543212": {
+    "CUST003": {
         "id": "CUST003",
         "name": "Amit Patel",
         "dob": "05-11-1988",
@@ -30,7 +36,7 @@ CUSTOMERS = {
 
 
 # Loan database (keyed by customer ID)
-LOANS = {
+_LOANS_RAW = {
     "CUST001": {
         "id": "LN001",
         "type": "Personal Loan",
@@ -63,14 +69,55 @@ LOANS = {
 
 
 
-def get_customer_by_phone(phone: str) -> dict | None:
-    """Look up customer by phone number."""
-    return CUSTOMERS.get(phone)
+# Reference data is read-only. Records are frozen too, since lookups hand
+# the same record objects to every caller (and to state._fetch_customer's
+# cache).
+CUSTOMERS = MappingProxyType({k: MappingProxyType(v) for k, v in _CUSTOMERS_RAW.items()})
+LOANS = MappingProxyType({k: MappingProxyType(v) for k, v in _LOANS_RAW.items()})
+
+
+# Characters kept when normalizing; any other separator (spaces, ASCII or
+# Unicode dashes, dots, brackets) is dropped
+_PHONE_KEEP = frozenset("0123456789+")
+
+# Length of a national number entered without a country code
+_LOCAL_NUMBER_LEN = 10
+
+# Phone number -> customer ID. A customer with several numbers gets one
+# entry per number, all pointing at the same record.
+PHONE_INDEX = {c["phone"]: cid for cid, c in CUSTOMERS.items()}
+
+# Secondary index so numbers entered without the country code still match.
+# Only consulted for local-only input, never for a number with another
+# country code that happens to share the last 10 digits.
+PHONE_INDEX_BY_LAST10 = {phone[-_LOCAL_NUMBER_LEN:]: cid for phone, cid in PHONE_INDEX.items()}
+
+
+
+
+def normalize_phone_number(phone: str) -> str:
+    """Strip everything but digits and "+" from a phone number."""
+    return "".join(filter(_PHONE_KEEP.__contains__, phone))
+
 
 
 
+def get_customer_by_phone(phone: str) -> Mapping | None:
+    """
+    Look up customer by phone number.
+    An exact match is required when a country code is given; a bare
+    10-digit local number falls back to matching the last 10 digits.
+    """
+    normalized = normalize_phone_number(phone)
+    customer_id = PHONE_INDEX.get(normalized)
+    if customer_id is None and len(normalized) == _LOCAL_NUMBER_LEN and normalized.isdigit():
+        customer_id = PHONE_INDEX_BY_LAST10.get(normalized)
+    return CUSTOMERS.get(customer_id)
 
-def get_loan_by_customer(customer_id: str) -> dict | None:
+
+
+
+def get_loan_by_customer(customer_id: str) -> Mapping | None:
     """Get loan details for a customer."""
     return LOANS.get(customer_id)
 
@@ -85,25 +132,59 @@ def get_customer_with_loan(phone: str) -> dict | None:
     loan = get_loan_by_customer(customer["id"])
     return {"customer": customer, "loan": loan}
 
+
+
+
+# Stored call outcome records (slotted: smaller than per-record dicts)
+@dataclass(slots=True, frozen=True)
+class PTPRecord:
+    id: str
+    customer_id: str
+    amount: float
+    date: str
+    plan_type: str
+
+
+@dataclass(slots=True, frozen=True)
+class DisputeRecord:
+    id: str
+    customer_id: str
+    reason: str
+
+
+@dataclass(slots=True, frozen=True)
+class CallRecord:
+    id: str
+    customer_id: str
+    outcome: str
+    payment_status: str | None
+    summary: str
+
+
 # In-memory storage for call outcomes
 # (In production, this would be saved to database)
-CALL_RECORDS = []
-PTP_RECORDS = []
-DISPUTE_RECORDS = []
+# Bounded so a long-running worker keeps only the most recent records
+MAX_RECORDS = 10000
+CALL_RECORDS = deque(maxlen=MAX_RECORDS)
+PTP_RECORDS = deque(maxlen=MAX_RECORDS)
+DISPUTE_RECORDS = deque(maxlen=MAX_RECORDS)
+
+# ID sequences (next() on a count is atomic under the GIL)
+_ptp_seq = count(1)
+_dispute_seq = count(1)
+_call_seq = count(1)
+
+_PTP_PREFIX = "PTP"
+_DISPUTE_PREFIX = "DSP"
+_CALL_PREFIX = "CALL"
 
 
 
 
 def save_ptp(customer_id: str, amount: float, date: str, plan_type: str) -> str:
     """Save Promise-to-Pay record. Returns PTP ID."""
-    ptp_id = f"PTP{len(PTP_RECORDS)+1:04d}"
-    PTP_RECORDS.append({
-        "id": ptp_id,
-        "customer_id": customer_id,
-        "amount": amount,
-        "date": date,
-        "plan_type": plan_type,
-    })
+    ptp_id = _PTP_PREFIX + format(next(_ptp_seq), "04")
+    PTP_RECORDS.append(PTPRecord(ptp_id, customer_id, amount, date, plan_type))
     return ptp_id
 
 
@@ -111,12 +192,8 @@ def save_ptp(customer_id: str, amount: float, date: str, plan_type: str) -> str:
 
 def save_dispute(customer_id: str, reason: str) -> str:
     """Save dispute record. Returns Dispute ID."""
-    dispute_id = f"DSP{len(DISPUTE_RECORDS)+1:04d}"
-    DISPUTE_RECORDS.append({
-        "id": dispute_id,
-        "customer_id": customer_id,
-        "reason": reason,
-    })
+    dispute_id = _DISPUTE_PREFIX + format(next(_dispute_seq), "04")
+    DISPUTE_RECORDS.append(DisputeRecord(dispute_id, customer_id, reason))
     return dispute_id
 
 
@@ -124,6 +201,6 @@ def save_dispute(customer_id: str, reason: str) -> str:
 
 def save_call_record(call_summary: dict) -> str:
     """Save call summary. Returns Call ID."""
-    call_id = f"CALL{len(CALL_RECORDS)+1:04d}"
-    CALL_RECORDS.append({"id": call_id, **call_summary})
+    call_id = _CALL_PREFIX + format(next(_call_seq), "04")
+    CALL_RECORDS.append(CallRecord(id=call_id, **call_summary))
     return call_id
@@ -1,5 +1,8 @@
 # src/graph.py
 
+import re
+from functools import lru_cache
+
 from langgraph.graph import StateGraph, END
 from src.state import CallState
 
@@ -11,65 +14,88 @@ from src.nodes.negotiation import negotiation_node
 from src.nodes.closing import closing_node
 
 
+# Phrases negotiation_node uses when it wraps up without a commitment
+_CLOSING_RE = re.compile(r"i've documented our discussion|we'll follow up with you", re.IGNORECASE)
+
+
+def _route_verification(state: CallState) -> str:
+    if state["is_verified"]:
+        return "disclosure"
+    return "verification"
+
+
+def _route_payment_check(state: CallState) -> str:
+    if state["payment_status"] == "willing":
+        return "negotiation"
+    return "closing"
+
+
+def _route_negotiation(state: CallState) -> str:
+    messages = state["messages"]
+    if messages:
+        last_msg = messages[-1]
+        # If last message contains closing phrases, go to closing
+        if last_msg["role"] == "assistant":
+            if _CLOSING_RE.search(last_msg["content"]):
+                return "closing"
+    
+    # Otherwise stay in negotiation
+    return "negotiation"
+
+
+# Stages whose next node is always the same
+_STAGE_ROUTES = {
+    "init": "greeting",
+    "greeting": "verification",
+    "disclosure": "payment_check",
+    "closing": END,
+}
+
+# Stages that branch on state -> router for the next node
+_STAGE_HANDLERS = {
+    "verification": _route_verification,
+    "payment_check": _route_payment_check,
+    "negotiation": _route_negotiation,
+}
+
+
 def should_continue(state: CallState) -> str:
     """
     Main routing function that determines next step based on current stage.
     """
-    stage = state.get("stage")
-    is_complete = state.get("is_complete")
-    awaiting_user = state.get("awaiting_user")
-    
-    # If call is complete, end
-    if is_complete:
-        return END
+    # These keys are always set by create_initial_state
+    is_complete, awaiting_user, stage = state["is_complete"], state["awaiting_user"], state["stage"]
     
-    # If awaiting user input, pause (return END to wait for user)
-    if awaiting_user:
+    # Call complete, or awaiting user input (return END to wait for user)
+    if is_complete or awaiting_user:
         return END
     
-    # Route based on stage
-    if stage == "init":
-        return "greeting"
+    # Unconditional transitions need no state inspection
+    route = _STAGE_ROUTES.get(stage)
+    if route is not None:
+        return route
     
-    elif stage == "greeting":
-        return "verification"
-    
-    elif stage == "verification":
-        if state.get("is_verified"):
-            return "disclosure"
-        return "verification"
-    
-    elif stage == "verified":
-        return "disclosure"
-    
-    elif stage == "disclosure":
-        return "payment_check"
-    
-    elif stage == "payment_check":
-        payment_status = state.get("payment_status")
-        if payment_status == "willing":
-            return "negotiation"
-        return "closing"
-    
-    elif stage == "negotiation":
-        messages = state.get("messages", [])
-        if messages:
-            last_msg = messages[-1]
-            # If last message contains closing phrases, go to closing
-            if last_msg.get("role") == "assistant":
-                content = last_msg.get("content", "").lower()
-                closing_phrases = ["i've documented our discussion", "we'll follow up with you"]
-                if any(phrase in content for phrase in closing_phrases):
-                    return "closing"
-        
-        # Otherwise stay in negotiation
-        return "negotiation"
-    
-    elif stage == "closing":
+    # Unknown stages end the run
+    handler = _STAGE_HANDLERS.get(stage)
+    if handler is None:
         return END
     
-    # Default: end
-    return END
+    return handler(state)
+
+
+# Router result -> node, shared by the entry point and every node's edges
+_ROUTE_MAP = {
+    "greeting": "greeting",
+    "verification": "verification",
+    "disclosure": "disclosure",
+    "payment_check": "payment_check",
+    "negotiation": "negotiation",
+    "closing": "closing",
+    END: END,
+}
+
+# Nodes that may pause for user input, so their next hop goes through the router
+_ROUTED_NODES = ("greeting", "verification", "disclosure", "payment_check", "negotiation")
 
 
 def create_graph():
@@ -84,36 +110,32 @@ def create_graph():
     graph.add_node("closing", closing_node)
 
     # Set conditional edges from each node
-    graph.set_conditional_entry_point(
-        should_continue,
-        {
-            "greeting": "greeting",
-            "verification": "verification",
-            "disclosure": "disclosure",
-            "payment_check": "payment_check",
-            "negotiation": "negotiation",
-            "closing": "closing",
-            END: END,
-        }
-    )
+    graph.set_conditional_entry_point(should_continue, _ROUTE_MAP)
     
-    # Each node routes through the same conditional logic
-    for node_name in ["greeting", "verification", "disclosure", "payment_check", "negotiation", "closing"]:
-        graph.add_conditional_edges(
-            node_name,
-            should_continue,
-            {
-                "greeting": "greeting",
-                "verification": "verification",
-                "disclosure": "disclosure",
-                "payment_check": "payment_check",
-                "negotiation": "negotiation",
-                "closing": "closing",
-                END: END,
-            }
-        )
+    # Each of these routes through the same conditional logic and edge map
+    for node_name in _ROUTED_NODES:
+        graph.add_conditional_edges(node_name, should_continue, _ROUTE_MAP)
+
+    # Closing always completes the call
+    graph.add_edge("closing", END)
 
     return graph
 
 
-app = create_graph().compile()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def build_app():
+    """
+    Compile the graph once per process.
+    Callers that need the compiled app share the same instance.
+    """
+    return create_graph().compile()
+
+
+def __getattr__(name):
+    # Compile lazily on first `src.graph.app` access, so importing the
+    # routing helpers alone doesn't pay for a graph build
+    if name == "app":
+        global app
+        app = build_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,12 +10,12 @@ def disclosure_node(state: CallState) -> dict:
     """
     
     # Skip if already disclosed - but don't change stage
-    if state.get("has_disclosed"):
+    if state["has_disclosed"]:
         return {
             "awaiting_user": False,  # Don't wait again, move on
         }
     
-    amount = state.get("outstanding_amount", 0)
+    amount = state["outstanding_amount"]
     
     message = (
         f"I'm calling regarding your outstanding payment of ₹{amount}. "
@@ -25,7 +25,7 @@ def disclosure_node(state: CallState) -> dict:
     
     return {
         "has_disclosed": True,
-        "messages": state["messages"] + [{
+        "messages": [{
             "role": "assistant",
             "content": message
         }],
@@ -10,23 +10,21 @@ def greeting_node(state: CallState) -> dict:
     """
 
     # Skip if already greeted
-    if state.get("has_greeted"):
+    if state["has_greeted"]:
         return {
             "stage": "greeting",
             "awaiting_user": False,
         }
 
-    first_name = state["customer_name"].split()[0]
-
     message = (
-        f"Hello {first_name}, good day. "
+        f"Hello {state['customer_first_name']}, good day. "
         f"This is a call from ABC Finance. "
         f"Am I speaking with {state['customer_name']}?"
     )
 
     return {
         "has_greeted": True,
-        "messages": state["messages"] + [{
+        "messages": [{
             "role": "assistant",
             "content": message
         }],
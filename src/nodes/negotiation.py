@@ -2,13 +2,66 @@
 
 from ..state import CallState
 from ..utils.llm import generate_negotiation_response, generate_payment_plans
+import logging
 import re
 
+log = logging.getLogger(__name__)
+
+# Patterns used on every turn by the commitment/date/amount parsers
+_AMOUNT_RE = re.compile(r'[₹Rs.\s]*(\d+(?:\.\d+)?)')
+_YEAR_RE = re.compile(r'20\d{2}')
+_NUMERIC_DATE_RE = re.compile(r'(\d{1,2})[-/\s](\d{1,2})[-/\s]?(202[5-9])')
+_MONTH_COUNT_RE = re.compile(r'(\d+)\s*month')
+_PLAN_NUMBER_RE = re.compile(r'(?:plan|option)\s*(\d+)')
+_PLAN_AMOUNT_RE = re.compile(r'₹(\d+(?:,\d+)*)')
+
+_MONTHS = {
+    'jan': '01', 'january': '01',
+    'feb': '02', 'february': '02',
+    'mar': '03', 'march': '03',
+    'apr': '04', 'april': '04',
+    'may': '05',
+    'jun': '06', 'june': '06',
+    'jul': '07', 'july': '07',
+    'aug': '08', 'august': '08',
+    'sep': '09', 'september': '09',
+    'oct': '10', 'october': '10',
+    'nov': '11', 'november': '11',
+    'dec': '12', 'december': '12',
+}
+
+# Longest names first so "january" wins over "jan"
+_MONTH_ALT = "|".join(sorted(_MONTHS, key=len, reverse=True))
+_MONTH_DATE_RE = re.compile(
+    rf'(\d{{1,2}})(?:st|nd|rd|th)?\s*({_MONTH_ALT})|({_MONTH_ALT})\s*(\d{{1,2}})'
+)
+
+# Phrases that mean the customer wants to wrap up the call
+_END_SIGNALS_RE = re.compile(
+    "|".join(map(re.escape, (
+        "no that's all", "no thanks bye", "goodbye", "bye bye", "nothing else", "that's all",
+    ))),
+    re.IGNORECASE,
+)
+
+# Customer asking to see or restructure payment plans
+_PLAN_REQUEST_RE = re.compile(
+    "|".join(map(re.escape, (
+        "payment plan", "installment", "emi", "monthly payment",
+        "break it up", "pay in parts", "split", "work out a plan",
+        "options", "what are my options", "can you offer",
+    ))),
+    re.IGNORECASE,
+)
+
+# Agent wording that marks a negotiation turn (matched against lowercased text)
+_NEGOTIATION_CUE_RE = re.compile("option|installment|plan|appreciate your willingness")
+
 
 def extract_amount(text: str) -> float:
     """Extract monetary amount from text."""
     text = text.replace(',', '')
-    matches = re.findall(r'[₹Rs.\s]*(\d+(?:\.\d+)?)', text)
+    matches = _AMOUNT_RE.findall(text)
     for match in matches:
         amount = float(match)
         if amount > 100:
@@ -20,36 +73,19 @@ def extract_date(text: str) -> str:
     """Extract date from text in various formats."""
     text_lower = text.lower()
     
-    months_map = {
-        'jan': '01', 'january': '01',
-        'feb': '02', 'february': '02',
-        'mar': '03', 'march': '03',
-        'apr': '04', 'april': '04',
-        'may': '05',
-        'jun': '06', 'june': '06',
-        'jul': '07', 'july': '07',
-        'aug': '08', 'august': '08',
-        'sep': '09', 'september': '09',
-        'oct': '10', 'october': '10',
-        'nov': '11', 'november': '11',
-        'dec': '12', 'december': '12',
-    }
-    
-    for month_name, month_num in months_map.items():
-        if month_name in text_lower:
-            day_match = re.search(r'(\d{1,2})(?:st|nd|rd|th)?\s*' + month_name, text_lower)
-            if not day_match:
-                day_match = re.search(month_name + r'\s*(\d{1,2})', text_lower)
-            
-            if day_match:
-                day = day_match.group(1)
-                if 1 <= int(day) <= 31:
-                    year_match = re.search(r'20\d{2}', text)
-                    year = year_match.group(0) if year_match else "2025"
-                    return f"{day.zfill(2)}-{month_num}-{year}"
+    # One scan finds "5th march" or "march 5" for any month spelling
+    for match in _MONTH_DATE_RE.finditer(text_lower):
+        if match.group(1):
+            day, month_name = match.group(1, 2)
+        else:
+            month_name, day = match.group(3, 4)
+        
+        if 1 <= int(day) <= 31:
+            year_match = _YEAR_RE.search(text)
+            year = year_match.group(0) if year_match else "2025"
+            return f"{day.zfill(2)}-{_MONTHS[month_name]}-{year}"
     
-    date_pattern = r'(\d{1,2})[-/\s](\d{1,2})[-/\s]?(202[5-9])'
-    match = re.search(date_pattern, text)
+    match = _NUMERIC_DATE_RE.search(text)
     if match:
         day, month, year = match.groups()
         if 1 <= int(day) <= 31 and 1 <= int(month) <= 12:
@@ -63,53 +99,52 @@ def has_commitment_details(state: CallState, last_user_input: str) -> tuple:
     Check if customer has provided both amount and date commitment.
     Returns (has_both, amount, date, plan_selected)
     """
-    messages = state.get("messages", [])
-    offered_plans = state.get("offered_plans", [])
+    messages = state["messages"]
+    offered_plans = state["offered_plans"]
     
     committed_amount = None
     committed_date = None
     selected_plan = None
     
-    # Find where verification ended
+    # Walk back once to find where verification ended and where plans
+    # were first offered after it
     verification_done_index = -1
-    for i, msg in enumerate(messages):
-        if msg.get("role") == "assistant":
-            content = msg.get("content", "").lower()
-            if "thank you for confirming" in content or "outstanding payment" in content:
-                verification_done_index = i
-    
-    # Find where plans were offered
     plan_offer_index = -1
-    for i, msg in enumerate(messages):
-        if msg.get("role") == "assistant" and i > verification_done_index:
-            if "option" in msg.get("content", "").lower() or "installment" in msg.get("content", "").lower():
-                plan_offer_index = i
-                break
+    for i in range(len(messages) - 1, -1, -1):
+        msg = messages[i]
+        if msg.get("role") != "assistant":
+            continue
+        content = msg.get("content", "").lower()
+        if "thank you for confirming" in content or "outstanding payment" in content:
+            verification_done_index = i
+            break
+        if "option" in content or "installment" in content:
+            plan_offer_index = i
     
     start_index = max(plan_offer_index, verification_done_index + 1) if plan_offer_index >= 0 else verification_done_index + 1
-    relevant_messages = messages[start_index:] if start_index >= 0 else messages[-3:]
+    relevant_messages = messages[start_index:]
     
-    print(f"[COMMITMENT] Checking {len(relevant_messages)} messages after plans offered")
-    if offered_plans:
-        print(f"[COMMITMENT] Available plans: {[p['name'] for p in offered_plans]}")
+    log.debug("[COMMITMENT] Checking %s messages after plans offered", len(relevant_messages))
+    if offered_plans and log.isEnabledFor(logging.DEBUG):
+        log.debug("[COMMITMENT] Available plans: %s", [p['name'] for p in offered_plans])
     
-    for msg in relevant_messages:
+    for msg_index, msg in enumerate(relevant_messages, start=start_index):
         if msg.get("role") == "user":
             content = msg.get("content", "").lower()
             
-            print(f"[COMMITMENT] Analyzing user message: '{content}'")
+            log.debug("[COMMITMENT] Analyzing user message: '%s'", content)
             
             if offered_plans and not selected_plan:
-                print(f"[COMMITMENT] Plans available: {len(offered_plans)}")
-                month_match = re.search(r'(\d+)\s*month', content)
+                log.debug("[COMMITMENT] Plans available: %s", len(offered_plans))
+                month_match = _MONTH_COUNT_RE.search(content)
                 if month_match:
                     months = int(month_match.group(1))
-                    print(f"[PLAN DETECTION] Found {months}-month mention in: '{content}'")
+                    log.debug("[PLAN DETECTION] Found %s-month mention in: '%s'", months, content)
                     for idx, plan in enumerate(offered_plans):
                         plan_name_lower = plan['name'].lower()
                         plan_desc_lower = plan['description'].lower()
                         
-                        print(f"[PLAN DETECTION] Checking plan {idx+1}: '{plan_name_lower}' / '{plan_desc_lower}'")
+                        log.debug("[PLAN DETECTION] Checking plan %s: '%s' / '%s'", idx+1, plan_name_lower, plan_desc_lower)
                         
                         matches = (
                             f"{months}-month" in plan_name_lower or
@@ -120,24 +155,24 @@ def has_commitment_details(state: CallState, last_user_input: str) -> tuple:
                         
                         if matches:
                             selected_plan = plan
-                            print(f"[PLAN DETECTION] ✅ Matched to plan: {plan['name']}")
-                            amount_match = re.search(r'₹(\d+(?:,\d+)*)', plan['description'])
+                            log.debug("[PLAN DETECTION] ✅ Matched to plan: %s", plan['name'])
+                            amount_match = _PLAN_AMOUNT_RE.search(plan['description'])
                             if amount_match:
                                 committed_amount = float(amount_match.group(1).replace(',', ''))
-                                print(f"[PLAN DETECTION] Amount: ₹{committed_amount:,.0f}")
+                                log.debug("[PLAN DETECTION] Amount: ₹%s", committed_amount)
                             break
                         else:
-                            print(f"[PLAN DETECTION] No match for {months} months")
+                            log.debug("[PLAN DETECTION] No match for %s months", months)
                 
                 if not selected_plan:
-                    plan_num_match = re.search(r'(?:plan|option)\s*(\d+)', content)
+                    plan_num_match = _PLAN_NUMBER_RE.search(content)
                     if plan_num_match:
                         plan_idx = int(plan_num_match.group(1)) - 1
-                        print(f"[PLAN DETECTION] Plan number {plan_idx + 1} selected")
+                        log.debug("[PLAN DETECTION] Plan number %s selected", plan_idx + 1)
                         if 0 <= plan_idx < len(offered_plans):
                             selected_plan = offered_plans[plan_idx]
-                            print(f"[PLAN DETECTION] Matched to: {selected_plan['name']}")
-                            amount_match = re.search(r'₹(\d+(?:,\d+)*)', selected_plan['description'])
+                            log.debug("[PLAN DETECTION] Matched to: %s", selected_plan['name'])
+                            amount_match = _PLAN_AMOUNT_RE.search(selected_plan['description'])
                             if amount_match:
                                 committed_amount = float(amount_match.group(1).replace(',', ''))
                 
@@ -150,14 +185,13 @@ def has_commitment_details(state: CallState, last_user_input: str) -> tuple:
                         selected_plan = offered_plans[min(2, len(offered_plans) - 1)]
                     
                     if selected_plan:
-                        print(f"[PLAN DETECTION] Position-based selection: {selected_plan['name']}")
-                        amount_match = re.search(r'₹(\d+(?:,\d+)*)', selected_plan['description'])
+                        log.debug("[PLAN DETECTION] Position-based selection: %s", selected_plan['name'])
+                        amount_match = _PLAN_AMOUNT_RE.search(selected_plan['description'])
                         if amount_match:
                             committed_amount = float(amount_match.group(1).replace(',', ''))
                 
                 if not selected_plan and any(phrase in content for phrase in ['works for me', 'i\'ll take', 'sounds good', 'that works', 'i accept']):
-                    print("[PLAN DETECTION] Acceptance phrase detected")
-                    msg_index = messages.index(msg)
+                    log.debug("[PLAN DETECTION] Acceptance phrase detected")
                     if msg_index > 0:
                         prev_msg = messages[msg_index - 1]
                         if prev_msg.get("role") == "assistant" and ("option" in prev_msg.get("content", "").lower()):
@@ -166,8 +200,8 @@ def has_commitment_details(state: CallState, last_user_input: str) -> tuple:
                             else:
                                 selected_plan = offered_plans[0]
                             
-                            print(f"[PLAN DETECTION] Assumed plan: {selected_plan['name']}")
-                            amount_match = re.search(r'₹(\d+(?:,\d+)*)', selected_plan['description'])
+                            log.debug("[PLAN DETECTION] Assumed plan: %s", selected_plan['name'])
+                            amount_match = _PLAN_AMOUNT_RE.search(selected_plan['description'])
                             if amount_match:
                                 committed_amount = float(amount_match.group(1).replace(',', ''))
             
@@ -175,17 +209,17 @@ def has_commitment_details(state: CallState, last_user_input: str) -> tuple:
                 date = extract_date(content)
                 if date:
                     committed_date = date
-                    print(f"[DATE DETECTION] Found date: {date}")
+                    log.debug("[DATE DETECTION] Found date: %s", date)
             
             if not committed_amount and not selected_plan:
                 amount = extract_amount(content)
                 if amount:
                     committed_amount = amount
-                    print(f"[AMOUNT DETECTION] Found explicit amount: {amount}")
+                    log.debug("[AMOUNT DETECTION] Found explicit amount: %s", amount)
     
     has_both = committed_amount is not None and committed_date is not None
     
-    print(f"[COMMITMENT] Final - Amount: {committed_amount}, Date: {committed_date}, Plan: {selected_plan['name'] if selected_plan else None}")
+    log.debug("[COMMITMENT] Final - Amount: %s, Date: %s, Plan: %s", committed_amount, committed_date, selected_plan['name'] if selected_plan else None)
     
     return has_both, committed_amount, committed_date, selected_plan
 
@@ -197,10 +231,11 @@ def negotiation_node(state: CallState) -> dict:
     """
 
     amount = state["outstanding_amount"]
-    customer_name = state["customer_name"].split()[0]
+    customer_name = state["customer_first_name"]
     
-    last_user_input = state.get("last_user_input") or ""
-    messages = state.get("messages", [])
+    last_user_input = state["last_user_input"] or ""
+    messages = state["messages"]
+    offered_plans = state["offered_plans"]
     
     negotiation_turns = 0
     in_negotiation = False
@@ -209,18 +244,18 @@ def negotiation_node(state: CallState) -> dict:
             content = msg.get("content", "").lower()
             if "outstanding payment" in content or "able to make this payment" in content:
                 in_negotiation = False
-            elif in_negotiation or any(keyword in content for keyword in ["option", "installment", "plan", "appreciate your willingness"]):
+            elif in_negotiation or _NEGOTIATION_CUE_RE.search(content):
                 in_negotiation = True
                 negotiation_turns += 1
     
-    print(f"[NEGOTIATION] Turn {negotiation_turns + 1}, User input: '{last_user_input}'")
+    log.debug("[NEGOTIATION] Turn %s, User input: '%s'", negotiation_turns + 1, last_user_input)
     
     commitment_result = has_commitment_details(state, last_user_input)
     has_both, committed_amount, committed_date, selected_plan = commitment_result
     
     # If we have both - CLOSE IMMEDIATELY
     if has_both:
-        print(f"[NEGOTIATION] ✅ Full commitment received - CLOSING NOW")
+        log.debug("[NEGOTIATION] ✅ Full commitment received - CLOSING NOW")
         
         plan_name = selected_plan['name'] if selected_plan else "Custom Payment Plan"
         
@@ -232,7 +267,7 @@ def negotiation_node(state: CallState) -> dict:
         
         # Return with is_complete=True to END the call
         return {
-            "messages": state["messages"] + [{
+            "messages": [{
                 "role": "assistant",
                 "content": response
             }],
@@ -248,13 +283,13 @@ def negotiation_node(state: CallState) -> dict:
         }
     
     if selected_plan and not committed_date:
-        print(f"[NEGOTIATION] Plan selected, asking for date")
+        log.debug("[NEGOTIATION] Plan selected, asking for date")
         response = (
             f"Great choice, {customer_name}! I've noted the {selected_plan['name']}. "
             f"When would you like to make your first payment?"
         )
         return {
-            "messages": state["messages"] + [{
+            "messages": [{
                 "role": "assistant",
                 "content": response
             }],
@@ -264,20 +299,19 @@ def negotiation_node(state: CallState) -> dict:
             "payment_status": "willing",
         }
     
-    end_signals = ["no that's all", "no thanks bye", "goodbye", "bye bye", "nothing else", "that's all"]
-    user_wants_to_end = any(signal in last_user_input.lower() for signal in end_signals)
+    user_wants_to_end = _END_SIGNALS_RE.search(last_user_input) is not None
     
     should_close = user_wants_to_end or negotiation_turns >= 8
     
     if should_close:
-        print(f"[NEGOTIATION] Closing conversation (user_wants_to_end={user_wants_to_end}, turns={negotiation_turns})")
+        log.debug("[NEGOTIATION] Closing conversation (user_wants_to_end=%s, turns=%s)", user_wants_to_end, negotiation_turns)
         response = (
             f"Thank you, {customer_name}. I've documented our discussion. "
             f"We'll follow up with you shortly to finalize the arrangement. "
             f"Have a good day."
         )
         return {
-            "messages": state["messages"] + [{
+            "messages": [{
                 "role": "assistant",
                 "content": response
             }],
@@ -286,19 +320,13 @@ def negotiation_node(state: CallState) -> dict:
             "last_user_input": None,
         }
     
-    plan_request_keywords = [
-        "payment plan", "installment", "emi", "monthly payment",
-        "break it up", "pay in parts", "split", "work out a plan",
-        "options", "what are my options", "can you offer"
-    ]
+    is_plan_request = _PLAN_REQUEST_RE.search(last_user_input) is not None
     
-    is_plan_request = any(keyword in last_user_input.lower() for keyword in plan_request_keywords)
-    
-    if negotiation_turns == 0 or (is_plan_request and not state.get("offered_plans")):
+    if negotiation_turns == 0 or (is_plan_request and not offered_plans):
         try:
             plans = generate_payment_plans(amount, customer_name)
         except Exception as e:
-            print(f"[NEGOTIATION] Error generating plans: {e}, using fallback")
+            log.warning("[NEGOTIATION] Error generating plans: %s, using fallback", e)
             from ..utils.llm import generate_fallback_plans
             plans = generate_fallback_plans(amount)
         
@@ -315,7 +343,7 @@ def negotiation_node(state: CallState) -> dict:
             
             return {
                 "offered_plans": plans,
-                "messages": state["messages"] + [{
+                "messages": [{
                     "role": "assistant",
                     "content": response
                 }],
@@ -326,7 +354,7 @@ def negotiation_node(state: CallState) -> dict:
             }
         else:
             return {
-                "messages": state["messages"] + [{
+                "messages": [{
                     "role": "assistant",
                     "content": (
                         f"I appreciate your willingness to work this out, {customer_name}. "
@@ -345,9 +373,9 @@ def negotiation_node(state: CallState) -> dict:
         recent_conversation += f"{role}: {msg['content']}\n"
     
     plans_context = ""
-    if state.get("offered_plans"):
+    if offered_plans:
         plans_context = "\n\nOffered plans:\n"
-        for plan in state["offered_plans"]:
+        for plan in offered_plans:
             plans_context += f"- {plan['name']}: {plan['description']}\n"
     
     context = f"""You are a professional debt collection agent.
@@ -368,7 +396,7 @@ Response:"""
     response = generate_negotiation_response(context)
     
     if not response:
-        print("[NEGOTIATION] Using smart template fallback")
+        log.debug("[NEGOTIATION] Using smart template fallback")
         
         if committed_date and not committed_amount and not selected_plan:
             response = (
@@ -382,7 +410,7 @@ Response:"""
             )
     
     return {
-        "messages": state["messages"] + [{
+        "messages": [{
             "role": "assistant",
             "content": response
         }],
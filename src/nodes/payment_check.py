@@ -1,7 +1,21 @@
 # src/nodes/payment_check.py
 
+import logging
+
 from ..state import CallState
-from ..utils.llm import classify_intent
+from ..utils.llm import classify_intent, ALLOWED_INTENTS
+
+log = logging.getLogger(__name__)
+
+
+# Normalize any spelling variations (just in case)
+_INTENT_ALIASES = {
+    "dispute": "disputed",
+    "call_back": "callback",
+    "call back": "callback",
+}
+
+_VALID_STATUSES = frozenset(ALLOWED_INTENTS)
 
 
 def payment_check_node(state: CallState) -> dict:
@@ -12,7 +26,7 @@ def payment_check_node(state: CallState) -> dict:
     and routes them to the appropriate next step.
     """
 
-    user_input = state.get("last_user_input")
+    user_input = state["last_user_input"]
 
     # If no input yet, wait for user response
     if not user_input or user_input.strip() == "":
@@ -22,28 +36,27 @@ def payment_check_node(state: CallState) -> dict:
         }
 
     # Classify intent using improved Gemini-based classifier
-    print(f"\n[PAYMENT_CHECK] Analyzing user input: '{user_input}'")
+    log.debug("[PAYMENT_CHECK] Analyzing user input: '%s'", user_input)
     intent = classify_intent(user_input).strip().lower()
-    print(f"[PAYMENT_CHECK] Classified intent: {intent}\n")
+    log.debug("[PAYMENT_CHECK] Classified intent: %s", intent)
 
-    # Normalize any spelling variations (just in case)
-    alias_map = {
-        "dispute": "disputed",
-        "call_back": "callback",
-        "call back": "callback",
-    }
-
-    payment_status = alias_map.get(intent, intent)
+    payment_status = _INTENT_ALIASES.get(intent, intent)
 
     # Validate that we got a valid status
-    valid_statuses = ["paid", "disputed", "callback", "unable", "willing"]
-    if payment_status not in valid_statuses:
-        print(f"[WARNING] Unexpected payment status: {payment_status}, defaulting to 'unable'")
+    if payment_status not in _VALID_STATUSES:
+        log.warning("[PAYMENT_CHECK] Unexpected payment status: %s, defaulting to 'unable'", payment_status)
         payment_status = "unable"
 
-    return {
+    update = {
         "payment_status": payment_status,
         "stage": "payment_check",
         "awaiting_user": False,
         "last_user_input": None,
-    }
\ No newline at end of file
+    }
+
+    # last_user_input is cleared above, so keep the customer's words for the
+    # dispute ticket closing_node raises
+    if payment_status == "disputed":
+        update["dispute_reason"] = user_input
+
+    return update
\ No newline at end of file
@@ -10,21 +10,21 @@ def verification_node(state: CallState) -> dict:
     """
 
     # Skip if already verified
-    if state.get("is_verified"):
+    if state["is_verified"]:
         return {
-            "stage": "verified",
+            "stage": "verification",
             "awaiting_user": False,
         }
 
-    attempts = state.get("verification_attempts", 0)
-    user_input = state.get("last_user_input")
+    attempts = state["verification_attempts"]
+    user_input = state["last_user_input"]
     expected_dob = state["customer_dob"].lower()
 
     # First time - ask for DOB
     if attempts == 0:
         return {
             "verification_attempts": 1,
-            "messages": state["messages"] + [{
+            "messages": [{
                 "role": "assistant",
                 "content": "For security purposes, could you please confirm your date of birth?"
             }],
@@ -52,11 +52,11 @@ def verification_node(state: CallState) -> dict:
     if any(dob in user_input for dob in dob_variations):
         return {
             "is_verified": True,
-            "messages": state["messages"] + [{
+            "messages": [{
                 "role": "assistant",
                 "content": "Thank you for confirming your details."
             }],
-            "stage": "verified",
+            "stage": "verification",
             "awaiting_user": False,
             "last_user_input": None,
         }
@@ -70,7 +70,7 @@ def verification_node(state: CallState) -> dict:
             "verification_attempts": new_attempts,
             "is_verified": False,
             "call_outcome": "verification_failed",
-            "messages": state["messages"] + [{
+            "messages": [{
                 "role": "assistant",
                 "content": (
                     "I'm sorry, I'm unable to verify your identity. "
@@ -86,7 +86,7 @@ def verification_node(state: CallState) -> dict:
     # Allow retry
     return {
         "verification_attempts": new_attempts,
-        "messages": state["messages"] + [{
+        "messages": [{
             "role": "assistant",
             "content": "That doesn't match our records. Please confirm your date of birth again."
         }],
@@ -1,6 +1,8 @@
 # src/state.py
 
-from typing import TypedDict, List, Optional, Literal
+import operator
+from functools import lru_cache
+from typing import Annotated, TypedDict, List, Optional, Literal
 from src.data import get_customer_with_loan
 
 
@@ -8,7 +10,6 @@ Stage = Literal[
     "init",
     "greeting",
     "verification",
-    "verified",
     "disclosure",
     "payment_check",
     "already_paid",
@@ -34,7 +35,8 @@ PaymentStatus = Literal[
 # =========================
 class CallState(TypedDict):
     # === Conversation ===
-    messages: List[dict]
+    # Nodes return only their new messages; the reducer appends them
+    messages: Annotated[List[dict], operator.add]
     stage: Stage
     turn_count: int
     last_user_input: Optional[str]
@@ -45,6 +47,7 @@ class CallState(TypedDict):
     # === Customer Info ===
     customer_id: str
     customer_name: str
+    customer_first_name: str
     customer_phone: str
     customer_dob: str
     
@@ -85,12 +88,25 @@ class CallState(TypedDict):
 # =========================
 # Initial State Factory
 # =========================
+@lru_cache(maxsize=128)
+def _fetch_customer(phone: str) -> Optional[dict]:
+    """
+    Cached customer + loan lookup.
+    Evaluation runs reuse the same few phone numbers many times.
+    CUSTOMERS and LOANS are read-only and fixed at import, so results
+    (including None for unknown phones) stay valid for the whole process.
+    Call _fetch_customer.cache_clear() if that data is ever reloaded.
+    """
+    return get_customer_with_loan(phone)
+
+
 def create_initial_state(phone: str) -> Optional[CallState]:
     """
     Create initial CallState using mock customer + loan data.
     Returns None if customer not found.
+    Only scalar fields are copied out, so the cached record is never mutated.
     """
-    data = get_customer_with_loan(phone)
+    data = _fetch_customer(phone)
     if not data:
         return None
     
@@ -110,6 +126,7 @@ def create_initial_state(phone: str) -> Optional[CallState]:
         # Customer
         customer_id=customer["id"],
         customer_name=customer["name"],
+        customer_first_name=customer["name"].partition(" ")[0] or "Customer",
         customer_phone=customer["phone"],
         customer_dob=customer["dob"],
         
@@ -6,10 +6,14 @@ Rule-based patterns act as quick shortcuts for obvious cases.
 """
 
 from dotenv import load_dotenv
+import logging
 import os
+import threading
 
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 # ------------------------------------------------------------------
 # Configuration
 # ------------------------------------------------------------------
@@ -39,17 +43,29 @@ ALLOWED_INTENTS = [
 
 _model_cache = None
 _working_model_name = None
+_model_lock = threading.Lock()
 
 def get_gemini_model():
     """
     Lazily initialize and cache Gemini model.
     Tries multiple model names until one works.
+    One model (and its client connections) is shared by every caller,
+    including concurrent evaluation runs.
     """
-    global _model_cache, _working_model_name
-    
     if _model_cache is not None:
         return _model_cache
     
+    with _model_lock:
+        # Another thread may have finished initializing while we waited
+        if _model_cache is not None:
+            return _model_cache
+        return _init_gemini_model()
+
+
+def _init_gemini_model():
+    """Configure Gemini and probe candidate models. Caller holds _model_lock."""
+    global _model_cache, _working_model_name
+    
     import google.generativeai as genai
 
     api_key = os.getenv("GEMINI_API_KEY")
@@ -62,7 +78,7 @@ def get_gemini_model():
     last_error = None
     for model_name in GEMINI_MODELS_TO_TRY:
         try:
-            print(f"[GEMINI] Trying model: {model_name}")
+            log.debug("[GEMINI] Trying model: %s", model_name)
             model = genai.GenerativeModel(model_name)
             
             # Test it with a simple generation
@@ -72,14 +88,14 @@ def get_gemini_model():
             )
             
             if test_response and test_response.text:
-                print(f"[GEMINI] ✅ Successfully initialized model: {model_name}")
+                log.debug("[GEMINI] ✅ Successfully initialized model: %s", model_name)
                 _model_cache = model
                 _working_model_name = model_name
                 return _model_cache
                 
         except Exception as e:
             last_error = e
-            print(f"[GEMINI] ❌ Model {model_name} failed: {str(e)[:100]}")
+            log.debug("[GEMINI] ❌ Model %s failed: %.100s", model_name, e)
             continue
     
     # If all models fail, raise the last error
@@ -96,12 +112,12 @@ def safe_get_response_text(response):
         if hasattr(response, 'prompt_feedback'):
             if hasattr(response.prompt_feedback, 'block_reason'):
                 if response.prompt_feedback.block_reason:
-                    print(f"[GEMINI] Prompt blocked: {response.prompt_feedback.block_reason}")
+                    log.warning("[GEMINI] Prompt blocked: %s", response.prompt_feedback.block_reason)
                     return None, True
         
         # Check if candidates exist
         if not response.candidates or len(response.candidates) == 0:
-            print("[GEMINI] No candidates in response")
+            log.warning("[GEMINI] No candidates in response")
             return None, True
         
         candidate = response.candidates[0]
@@ -111,7 +127,7 @@ def safe_get_response_text(response):
             finish_reason = candidate.finish_reason
             if hasattr(finish_reason, 'name'):
                 if finish_reason.name in ['SAFETY', 'RECITATION', 'OTHER']:
-                    print(f"[GEMINI] Candidate blocked: {finish_reason.name}")
+                    log.warning("[GEMINI] Candidate blocked: %s", finish_reason.name)
                     return None, True
         
         # Try multiple methods to get text
@@ -124,7 +140,7 @@ def safe_get_response_text(response):
                 if parts and len(parts) > 0:
                     text = ''.join([part.text for part in parts if hasattr(part, 'text')])
         except (KeyError, AttributeError) as e:
-            print(f"[GEMINI] Error accessing content.parts: {e}")
+            log.debug("[GEMINI] Error accessing content.parts: %s", e)
         
         # Method 2: Try direct text access
         if not text:
@@ -132,7 +148,7 @@ def safe_get_response_text(response):
                 if hasattr(response, 'text') and response.text:
                     text = response.text
             except (KeyError, AttributeError, ValueError) as e:
-                print(f"[GEMINI] Error accessing response.text: {e}")
+                log.debug("[GEMINI] Error accessing response.text: %s", e)
         
         # Method 3: Try candidate.text
         if not text:
@@ -140,16 +156,16 @@ def safe_get_response_text(response):
                 if hasattr(candidate, 'text'):
                     text = candidate.text
             except (KeyError, AttributeError) as e:
-                print(f"[GEMINI] Error accessing candidate.text: {e}")
+                log.debug("[GEMINI] Error accessing candidate.text: %s", e)
         
         if text and len(text.strip()) > 0:
             return text.strip(), False
         
-        print("[GEMINI] No text found in response")
+        log.warning("[GEMINI] No text found in response")
         return None, True
         
     except Exception as e:
-        print(f"[GEMINI] Unexpected error extracting text: {type(e).__name__} - {e}")
+        log.warning("[GEMINI] Unexpected error extracting text: %s - %s", type(e).__name__, e)
         return None, True
 
 
@@ -162,7 +178,7 @@ def classify_intent_with_gemini(prompt: str) -> str:
     try:
         model = get_gemini_model()
     except Exception as e:
-        print(f"Error initializing Gemini: {e}")
+        log.warning("Error initializing Gemini: %s", e)
         return classify_intent_rule_based(prompt)
 
     # Simplified prompt to avoid safety filters
@@ -192,7 +208,7 @@ Classification:"""
         text, was_blocked = safe_get_response_text(response)
         
         if was_blocked or not text:
-            print("Gemini classification blocked, using rule-based fallback")
+            log.warning("Gemini classification blocked, using rule-based fallback")
             rule_intent = classify_intent_rule_based(prompt)
             return rule_intent if rule_intent != "unknown" else "disputed"
         
@@ -208,12 +224,12 @@ Classification:"""
                 return valid_intent
         
         # Fallback
-        print(f"Warning: Gemini returned unexpected intent '{intent}'")
+        log.warning("Gemini returned unexpected intent '%s'", intent)
         rule_intent = classify_intent_rule_based(prompt)
         return rule_intent if rule_intent != "unknown" else "disputed"
         
     except Exception as e:
-        print(f"Error in Gemini classification: {e}")
+        log.warning("Error in Gemini classification: %s", e)
         rule_intent = classify_intent_rule_based(prompt)
         dispute_keywords = ["not right", "doesnt seem", "doesn't seem", "wrong", "mistake", "not mine"]
         if any(kw in prompt.lower() for kw in dispute_keywords):
@@ -321,12 +337,12 @@ def classify_intent(prompt: str) -> str:
     rule_intent = classify_intent_rule_based(prompt)
     
     if rule_intent in ALLOWED_INTENTS:
-        print(f"[INTENT] Rule-based: {rule_intent}")
+        log.debug("[INTENT] Rule-based: %s", rule_intent)
         return rule_intent
     
-    print(f"[INTENT] Using Gemini for: '{prompt[:50]}...'")
+    log.debug("[INTENT] Using Gemini for: '%.50s...'", prompt)
     gemini_intent = classify_intent_with_gemini(prompt)
-    print(f"[INTENT] Gemini classified as: {gemini_intent}")
+    log.debug("[INTENT] Gemini classified as: %s", gemini_intent)
     
     return gemini_intent
 
@@ -366,13 +382,13 @@ Respond professionally in 2-3 sentences."""
         text, was_blocked = safe_get_response_text(response)
         
         if was_blocked or not text or len(text.strip()) < 20:
-            print("Warning: Gemini response blocked or incomplete, using template")
+            log.warning("Gemini response blocked or incomplete, using template")
             raise Exception("Blocked or incomplete response")
         
         return text
         
     except Exception as e:
-        print(f"Error generating negotiation response: {e}")
+        log.warning("Error generating negotiation response: %s", e)
         # Return None to signal fallback needed
         return None
 
@@ -413,7 +429,7 @@ Generate plans:"""
         text, was_blocked = safe_get_response_text(response)
         
         if was_blocked or not text:
-            print("Warning: Plan generation blocked, using fallback")
+            log.warning("Plan generation blocked, using fallback")
             raise Exception("Response blocked")
         
         # Extract JSON
@@ -430,13 +446,13 @@ Generate plans:"""
                     if 'name' not in plan or 'description' not in plan:
                         raise Exception("Invalid plan structure")
                 
-                print(f"[PLANS] Generated {len(plans)} payment plans")
+                log.debug("[PLANS] Generated %s payment plans", len(plans))
                 return plans
         
         raise Exception("Could not extract valid JSON")
         
     except Exception as e:
-        print(f"Error generating payment plans: {e}")
+        log.warning("Error generating payment plans: %s", e)
         return generate_fallback_plans(outstanding_amount)
 
 
@@ -475,5 +491,5 @@ def generate_fallback_plans(amount: float) -> list:
             "description": f"Pay ₹{monthly_2:,.0f} per month for 2 months"
         })
     
-    print(f"[PLANS] Using fallback plans ({len(plans)} options)")
+    log.debug("[PLANS] Using fallback plans (%s options)", len(plans))
     return plans
\ No newline at end of file
@@ -0,0 +1,86 @@
+# tests/test_call_flow.py
+
+from typing import get_args
+
+from src.data import DISPUTE_RECORDS
+from src.graph import app
+from src.nodes.closing import closing_node
+from src.state import Stage, create_initial_state
+
+
+def run(phone, user_msgs):
+    """
+    Drive the graph the way main.py does: clear awaiting_user before each
+    resume. Returns the final state and the stage after every invoke.
+    """
+    state = app.invoke(create_initial_state(phone))
+    stages = [state["stage"]]
+
+    for msg in user_msgs:
+        if state["is_complete"]:
+            break
+        state["messages"].append({"role": "user", "content": msg})
+        state["last_user_input"] = msg
+        state["awaiting_user"] = False
+        state = app.invoke(state)
+        stages.append(state["stage"])
+    return state, stages
+
+
+def test_dispute_records_customer_reason():
+    result, _ = run("+919876543212", [
+        "Yes",
+        "05-11-1988",
+        "This is wrong, I never took this loan"
+    ])
+    assert result["payment_status"] == "disputed"
+    assert result["is_complete"] is True
+
+    record = DISPUTE_RECORDS[-1]
+    assert record.customer_id == "CUST003"
+    assert record.reason == "This is wrong, I never took this loan"
+    assert result["dispute_id"] == record.id
+    assert result["dispute_reason"] == record.reason
+
+
+def test_closing_prefers_stored_dispute_reason():
+    state = create_initial_state("+919876543212")
+    state["payment_status"] = "disputed"
+    state["dispute_reason"] = "I never took this loan"
+    state["last_user_input"] = "ok bye"
+
+    update = closing_node(state)
+    assert update["dispute_reason"] == "I never took this loan"
+    assert DISPUTE_RECORDS[-1].reason == "I never took this loan"
+
+
+def test_verification_moves_straight_to_disclosure():
+    result, stages = run("+919876543211", [
+        "Yes",
+        "22-07-1990",
+        "I already paid last week"
+    ])
+    assert result["is_verified"] is True
+    assert stages == ["greeting", "verification", "disclosure", "closing"]
+    assert all(stage in get_args(Stage) for stage in stages)
+
+
+def test_node_messages_are_appended_once():
+    result, _ = run("+919876543211", [
+        "Yes",
+        "22-07-1990",
+        "I already paid last week"
+    ])
+    roles = [msg["role"] for msg in result["messages"]]
+    assert roles == [
+        "assistant",  # greeting
+        "user",
+        "assistant",  # DOB request
+        "user",
+        "assistant",  # verified
+        "assistant",  # disclosure
+        "user",
+        "assistant",  # closing
+    ]
+    contents = [msg["content"] for msg in result["messages"]]
+    assert len(set(contents)) == len(contents)
@@ -0,0 +1,61 @@
+# tests/test_negotiation.py
+
+from src.nodes.negotiation import extract_date, has_commitment_details
+
+
+def test_day_before_month():
+    assert extract_date("I can pay on 5th March 2026") == "05-03-2026"
+    assert extract_date("15 JANUARY") == "15-01-2025"
+
+
+def test_month_before_day():
+    assert extract_date("march 5") == "05-03-2025"
+    assert extract_date("january 1") == "01-01-2025"
+
+
+def test_numeric_date_fallback():
+    assert extract_date("pay on 12/10/2025") == "12-10-2025"
+
+
+def test_out_of_range_day_is_rejected():
+    assert extract_date("99 june") is None
+
+
+def test_first_date_in_text_wins():
+    assert extract_date("jun 1 may") == "01-06-2025"
+    assert extract_date("99 june, or jun 9 2030") == "09-06-2030"
+
+
+def test_no_date():
+    assert extract_date("I will pay soon") is None
+
+
+def test_acceptance_uses_its_own_position_in_the_history():
+    plans = [
+        {"name": "Full Payment", "description": "Pay ₹50,000 in one go"},
+        {"name": "3-Month Plan", "description": "Pay ₹16,667 per month"},
+    ]
+    messages = [
+        # Before verification ends: must be outside the commitment window
+        {"role": "assistant", "content": "Are you calling about the installment option?"},
+        {"role": "user", "content": "I can pay 9000 on 1st january 2026"},
+        {"role": "assistant", "content": "Thank you for confirming your identity."},
+        {"role": "assistant", "content": "You have an outstanding payment of ₹50,000."},
+        {"role": "user", "content": "I want to pay"},
+        {"role": "assistant", "content": "Let me show you some options."},
+        {"role": "user", "content": "Is there any interest?"},
+        {"role": "assistant", "content": "No extra interest applies."},
+        # Not preceded by a plan offer, so this one selects nothing
+        {"role": "user", "content": "sounds good"},
+        {"role": "assistant", "content": "Which option works best for you?"},
+        # Identical text, but this one follows the plan offer
+        {"role": "user", "content": "sounds good"},
+        {"role": "user", "content": "I will pay on 5th march 2026"},
+    ]
+    state = {"messages": messages, "offered_plans": plans}
+
+    has_both, amount, date, plan = has_commitment_details(state, "I will pay on 5th march 2026")
+    assert has_both is True
+    assert plan is plans[1]
+    assert amount == 16667
+    assert date == "05-03-2026"
@@ -0,0 +1,27 @@
+# tests/test_phone_lookup.py
+
+from src.data import get_customer_by_phone
+
+
+def test_exact_number():
+    assert get_customer_by_phone("+919876543210")["id"] == "CUST001"
+
+
+def test_local_number_without_country_code():
+    assert get_customer_by_phone("9876543211")["id"] == "CUST002"
+
+
+def test_wrong_country_code_does_not_match():
+    assert get_customer_by_phone("+449876543210") is None
+    assert get_customer_by_phone("0019876543210") is None
+
+
+def test_formatted_number():
+    assert get_customer_by_phone("+91 98765-43210")["id"] == "CUST001"
+    assert get_customer_by_phone("+91–98765–43212")["id"] == "CUST003"
+    assert get_customer_by_phone("(987) 654-3211")["id"] == "CUST002"
+
+
+def test_unknown_number():
+    assert get_customer_by_phone("+919999999999") is None
+    assert get_customer_by_phone("") is None